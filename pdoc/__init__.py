@@ -19,14 +19,14 @@ import sys
 import typing
 from contextlib import contextmanager
 from copy import copy
-from functools import cached_property, lru_cache, reduce, partial, wraps
-from itertools import tee, groupby
+from functools import cached_property, lru_cache, partial, wraps
+from itertools import groupby
+from operator import attrgetter
 from types import FunctionType, ModuleType
 from typing import (  # noqa: F401
     cast, Any, Callable, Dict, Generator, Iterable, List, Literal, Mapping, NewType,
     Optional, Set, Tuple, Type, TypeVar, Union,
 )
-from unittest.mock import Mock
 from warnings import warn
 
 from mako.lookup import TemplateLookup
@@ -39,8 +39,6 @@ except ImportError:
     __version__ = '???'  # Package not installed
 
 
-_get_type_hints = lru_cache()(typing.get_type_hints)
-
 _URL_MODULE_SUFFIX = '.html'
 _URL_INDEX_MODULE_SUFFIX = '.m.html'  # For modules named literal 'index'
 _URL_PACKAGE_SUFFIX = '/index.html'
@@ -48,8 +46,19 @@ _URL_PACKAGE_SUFFIX = '/index.html'
 # type.__module__ can be None by the Python spec. In those cases, use this value
 _UNKNOWN_MODULE = '?'
 
+_BLANK_LINES_RE = re.compile('\n\n\n+')
+_FORWARD_REF_RE = re.compile(r'\bForwardRef\((?P<quot>[\"\'])(?P<str>.*?)(?P=quot)\)')
+_DOTTED_NAME_RE = re.compile(r'[\w\.]+')
+_OBJ_ADDRESS_RE = re.compile(r' at 0x\w+')
+
+# Name of module reloaded with `import_module()` -> source file mtimes of it
+# and its submodules as of its last (re)load
+_module_mtimes: Dict[str, Dict[str, Optional[float]]] = {}
+
 T = TypeVar('T', 'Module', 'Class', 'Function', 'Variable')
 
+_refname_key = attrgetter('refname')  # Same order as Doc.__lt__, but faster
+
 __pdoc__: Dict[str, Union[bool, str]] = {}
 
 tpl_lookup = TemplateLookup(
@@ -99,9 +108,17 @@ def reset():
 
     # Clear LRU caches
     for func in (_get_type_hints,
+                 _signature,
+                 _parse_module_source,
+                 _class_nodes,
                  _is_blacklisted,
                  _is_whitelisted):
         func.cache_clear()
+    from pdoc.html_helpers import _ToMarkdown
+    for func in (_ToMarkdown._directive,
+                 _ToMarkdown._admonitions_cached,
+                 _ToMarkdown._read_include):
+        func.cache_clear()
     for cls in (Doc, Module, Class, Function, Variable, External):
         for _, method in inspect.getmembers(cls):
             if isinstance(method, property):
@@ -110,12 +127,24 @@ def reset():
                 method.cache_clear()
 
 
+@lru_cache()
+def _default_config_module():
+    """Returns the compiled module of pdoc's default config.mako."""
+    DEFAULT_CONFIG = path.join(path.dirname(__file__), 'templates', 'config.mako')
+    return Template(filename=DEFAULT_CONFIG).module
+
+
+@lru_cache()
+def _mako_internals():
+    """Returns the names every compiled Mako template module defines."""
+    return frozenset(Template('').module.__dict__)
+
+
 def _get_config(**kwargs):
     # Apply config.mako configuration
-    MAKO_INTERNALS = Template('').module.__dict__.keys()
-    DEFAULT_CONFIG = path.join(path.dirname(__file__), 'templates', 'config.mako')
+    MAKO_INTERNALS = _mako_internals()
     config = {}
-    for config_module in (Template(filename=DEFAULT_CONFIG).module,
+    for config_module in (_default_config_module(),
                           tpl_lookup.get_template('/config.mako').module):
         config.update((var, getattr(config_module, var, None))
                       for var in config_module.__dict__
@@ -219,10 +248,18 @@ def import_module(
         finally:
             sys.path.remove(path)
 
+    def _mtime(module):
+        try:
+            return os.stat(module.__file__).st_mtime
+        except (AttributeError, TypeError, OSError):
+            return None
+
+    is_fresh_import = False
     if isinstance(module, Module):
         module = module.obj
     if isinstance(module, str):
         with _module_path(module) as module_path:
+            is_fresh_import = module_path not in sys.modules
             try:
                 module = importlib.import_module(module_path)
             except Exception as e:
@@ -236,24 +273,104 @@ def import_module(
     # If this is pdoc itself, return without reloading. Otherwise later
     # `isinstance(..., pdoc.Doc)` calls won't work correctly.
     if reload and not module.__name__.startswith(__name__):
-        module = importlib.reload(module)
-        # We recursively reload all submodules, in case __all_ is used - cf. issue #264
-        for mod_key, mod in list(sys.modules.items()):
-            if mod_key.startswith(module.__name__):
+        # We recursively reload all submodules, in case __all_ is used - cf. issue #264.
+        # Skip reloading when none of the source files changed since the last
+        # load of this very module. The snapshot is kept per requested module
+        # since reloading only a submodule leaves its parent's re-exports stale.
+        prefix = module.__name__ + '.'
+        submodules = [mod for mod_key, mod in list(sys.modules.items())
+                      if mod_key.startswith(prefix) and inspect.ismodule(mod)]
+        mtimes = {mod.__name__: _mtime(mod) for mod in [module] + submodules}
+        if mtimes != _module_mtimes.get(module.__name__) and not is_fresh_import:
+            module = importlib.reload(module)
+            for mod in submodules:
                 importlib.reload(mod)
+        _module_mtimes[module.__name__] = mtimes
     return module
 
 
-def _pairwise(iterable):
-    """s -> (s0,s1), (s1,s2), (s2, s3), ..."""
-    a, b = tee(iterable)
-    next(b, None)
-    return zip(a, b)
+def _module_source(module: ModuleType) -> Tuple[ast.Module, List[str]]:
+    """
+    Returns the parsed AST and the source lines of `module`.
+    The result is cached until the module's source file changes.
+    """
+    filename = getattr(module, '__file__', None)
+    try:
+        mtime = os.stat(filename).st_mtime_ns if filename else None
+    except OSError:
+        mtime = None
+    return _parse_module_source(module, mtime)
+
+
+@lru_cache()
+def _parse_module_source(module: ModuleType, mtime: Optional[int]):
+    lines, _ = inspect.findsource(module)
+    return ast.parse(''.join(lines)), lines
+
+
+@lru_cache()
+def _class_nodes(tree: ast.Module) -> Dict[str, ast.ClassDef]:
+    """
+    Returns a mapping of qualified class names to their `ast.ClassDef`
+    nodes in `tree`, resolved the same way `inspect.findsource()` does.
+    """
+    nodes: Dict[str, ast.ClassDef] = {}
+
+    def walk(node, prefix):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                qualname = prefix + child.name
+                nodes.setdefault(qualname, child)
+                walk(child, qualname + '.')
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                walk(child, f'{prefix}{child.name}.<locals>.')
+            elif not isinstance(child, ast.expr):  # Expressions can't contain classes
+                walk(child, prefix)
+
+    walk(tree, '')
+    return nodes
+
+
+def _class_node(cls: type) -> Tuple[ast.ClassDef, List[str]]:
+    """
+    Returns the `ast.ClassDef` node of `cls` from the cached AST of its
+    module, and the module's source lines. Raises `KeyError` if the class
+    definition can't be found.
+    """
+    tree, lines = _module_source(sys.modules[cls.__module__])
+    node = _class_nodes(tree)[cls.__qualname__]
+    # Python 3.13+ inspect locates classes by `__firstlineno__` instead
+    if (sys.version_info >= (3, 13) and
+            vars(cls)['__firstlineno__'] != _class_first_lineno(node)):
+        raise KeyError(cls.__qualname__)
+    return node, lines
+
+
+def _class_first_lineno(node: ast.ClassDef) -> int:
+    return (node.decorator_list[0] if node.decorator_list else node).lineno
+
+
+def _getsourcelines(obj) -> List[str]:
+    """
+    Returns the source lines of `obj` like `inspect.getsourcelines()`,
+    but looks classes up in the cached AST of their module instead of
+    re-parsing the whole module source for each class.
+    """
+    obj = inspect.unwrap(obj)
+    if inspect.isclass(obj):
+        try:
+            node, lines = _class_node(obj)
+        except (KeyError, OSError, TypeError, SyntaxError, ValueError):
+            pass  # Let inspect raise an appropriate error
+        else:
+            return inspect.getblock(lines[_class_first_lineno(node) - 1:])
+    return inspect.getsourcelines(obj)[0]
 
 
 def _pep224_docstrings(doc_obj: Union['Module', 'Class'], *,
-                       _init_tree=None) -> Tuple[Dict[str, str],
-                                                 Dict[str, str]]:
+                       _init_tree=None,
+                       _source_lines=None) -> Tuple[Dict[str, str],
+                                                    Dict[str, str]]:
     """
     Extracts PEP-224 docstrings and doc-comments (`#: ...`) for variables of `doc_obj`
     (either a `pdoc.Module` or `pdoc.Class`).
@@ -270,13 +387,21 @@ def _pep224_docstrings(doc_obj: Union['Module', 'Class'], *,
     instance_vars: Dict[str, str] = {}
 
     if _init_tree:
-        tree = _init_tree
+        tree, source_lines = _init_tree, _source_lines
     else:
         try:
-            # Maybe raise exceptions with appropriate message
-            # before using cleaned doc_obj.source
-            _ = inspect.findsource(doc_obj.obj)
-            tree = ast.parse(doc_obj.source)
+            if isinstance(doc_obj, Module):
+                tree, source_lines = _module_source(doc_obj.obj)
+            else:
+                try:
+                    tree, source_lines = _class_node(doc_obj.obj)
+                except (KeyError, OSError, TypeError, SyntaxError, ValueError):
+                    # Maybe raise exceptions with appropriate message
+                    # before using cleaned doc_obj.source
+                    _ = inspect.findsource(doc_obj.obj)
+                    tree = ast.parse(doc_obj.source)
+                    tree = tree.body[0]  # ast.parse creates a dummy ast.Module wrapper
+                    source_lines = doc_obj.source.splitlines()
         except (OSError, TypeError, SyntaxError, UnicodeDecodeError) as exc:
             # Don't emit a warning for builtins that don't have source available
             is_builtin = getattr(doc_obj.obj, '__module__', None) == 'builtins'
@@ -286,13 +411,12 @@ def _pep224_docstrings(doc_obj: Union['Module', 'Class'], *,
             return {}, {}
 
         if isinstance(doc_obj, Class):
-            tree = tree.body[0]  # ast.parse creates a dummy ast.Module wrapper
-
             # For classes, maybe add instance variables defined in __init__
             # Get the *last* __init__ node in case it is preceded by @overloads.
             for node in reversed(tree.body):
                 if isinstance(node, ast.FunctionDef) and node.name == '__init__':
-                    instance_vars, _ = _pep224_docstrings(doc_obj, _init_tree=node)
+                    instance_vars, _ = _pep224_docstrings(doc_obj, _init_tree=node,
+                                                          _source_lines=source_lines)
                     break
 
     def get_name(assign_node):
@@ -321,47 +445,43 @@ def _pep224_docstrings(doc_obj: Union['Module', 'Class'], *,
 
         return name
 
-    # For handling PEP-224 docstrings for variables
-    for assign_node, str_node in _pairwise(ast.iter_child_nodes(tree)):
-        if not (isinstance(assign_node, (ast.Assign, ast.AnnAssign)) and
-                isinstance(str_node, ast.Expr) and
-                isinstance(str_node.value, ast.Constant)):
-            continue
-
-        name = get_name(assign_node)
-        if not name:
-            continue
-
-        docstring = inspect.cleandoc(str_node.value.value).strip()
-        if not docstring:
-            continue
-
-        vars[name] = docstring
+    def get_indent(line):
+        return len(line) - len(line.lstrip())
 
-    # For handling '#:' docstrings for variables
-    for assign_node in ast.iter_child_nodes(tree):
-        if not isinstance(assign_node, (ast.Assign, ast.AnnAssign)):
+    MARKER = '#: '
+    comment_vars: Dict[str, str] = {}
+    body = tree.body
+    last = len(body) - 1
+    for i, assign_node in enumerate(body):
+        # Exact type checks; these run for every statement
+        if not (type(assign_node) is ast.Assign or type(assign_node) is ast.AnnAssign):
             continue
 
         name = get_name(assign_node)
         if not name:
             continue
 
-        # Already documented. PEP-224 method above takes precedence.
-        if name in vars:
-            continue
-
-        def get_indent(line):
-            return len(line) - len(line.lstrip())
+        # For handling PEP-224 docstrings for variables
+        str_node = body[i + 1] if i < last else None
+        if (type(str_node) is ast.Expr and
+                type(str_node.value) is ast.Constant and
+                isinstance(str_node.value.value, str)):
+            docstring = str_node.value.value
+            # For single-line docstrings, cleandoc() amounts to this
+            docstring = (inspect.cleandoc(docstring) if '\n' in docstring else
+                         docstring.expandtabs()).strip()
+            if docstring:
+                vars[name] = docstring
+                continue
 
-        source_lines = doc_obj.source.splitlines()
-        assign_line = source_lines[assign_node.lineno - 1]
+        # For handling '#:' docstrings for variables
+        assign_line = source_lines[assign_node.lineno - 1].rstrip('\r\n')
         assign_indent = get_indent(assign_line)
         comment_lines = []
-        MARKER = '#: '
-        for line in reversed(source_lines[:assign_node.lineno - 1]):
+        for j in range(assign_node.lineno - 2, -1, -1):
+            line = source_lines[j]
             if get_indent(line) == assign_indent and line.lstrip().startswith(MARKER):
-                comment_lines.append(line.split(MARKER, maxsplit=1)[1])
+                comment_lines.append(line.split(MARKER, maxsplit=1)[1].rstrip('\r\n'))
             else:
                 break
 
@@ -373,7 +493,12 @@ def _pep224_docstrings(doc_obj: Union['Module', 'Class'], *,
             comment_lines.append(assign_line.rsplit(MARKER, maxsplit=1)[1])
 
         if comment_lines:
-            vars[name] = '\n'.join(comment_lines)
+            # The first documented assignment wins
+            comment_vars.setdefault(name, '\n'.join(comment_lines))
+
+    # PEP-224 docstrings take precedence over '#:' comments
+    for name, docstring in comment_vars.items():
+        vars.setdefault(name, docstring)
 
     return vars, instance_vars
 
@@ -410,23 +535,79 @@ def _is_blacklisted(name: str, doc_obj: Union['Module', 'Class']):
     return False
 
 
+def _pdoc_overrides(doc_obj: 'Class') -> Tuple[Set[str], Set[str]]:
+    """
+    Returns the sets of member names of `doc_obj` that are whitelisted
+    and blacklisted, respectively, in `__pdoc__` of its module or any of
+    its supermodules. Equivalent to calling `_is_whitelisted()` and
+    `_is_blacklisted()` for each member, but in one pass over `__pdoc__`.
+    """
+    whitelisted, blacklisted = set(), set()
+    refname = doc_obj.refname
+    module: Optional[Module] = doc_obj.module
+    while module:
+        prefixes = (refname[len(module.refname) + 1:] + '.', refname + '.')
+        for key, value in module.__pdoc__.items():
+            for prefix in prefixes:
+                if key.startswith(prefix):
+                    name = key[len(prefix):]
+                    if value is False:
+                        blacklisted.add(name)
+                    elif value:
+                        whitelisted.add(name)
+        module = module.supermodule
+    return whitelisted, blacklisted
+
+
 def _is_public(ident_name):
     """
     Returns `True` if `ident_name` matches the export criteria for an
     identifier name.
     """
-    return not ident_name.startswith("_")
+    return ident_name[:1] != "_"
 
 
 def _is_function(obj):
-    return inspect.isroutine(obj) and callable(obj) and not isinstance(obj, Mock)  # Mock: GH-350
+    return inspect.isroutine(obj) and callable(obj) and not _is_mock(obj)  # Mock: GH-350
+
+
+def _is_mock(obj):
+    # Avoid importing unittest.mock (and asyncio with it) on every run.
+    # If it was never imported, `obj` can't be a Mock.
+    mock = sys.modules.get('unittest.mock')
+    return mock is not None and isinstance(obj, mock.Mock)
 
 
 def _is_descriptor(obj):
-    return (inspect.isdatadescriptor(obj) or
-            inspect.ismethoddescriptor(obj) or
-            inspect.isgetsetdescriptor(obj) or
-            inspect.ismemberdescriptor(obj))
+    # Getset and member descriptors are data descriptors, too
+    return inspect.isdatadescriptor(obj) or inspect.ismethoddescriptor(obj)
+
+
+def maybe_lru_cache(func):
+    cached_func = lru_cache()(func)
+
+    @wraps(func)
+    def wrapper(*args):
+        try:
+            return cached_func(*args)
+        except TypeError:
+            return func(*args)
+
+    wrapper.cache_clear = cached_func.cache_clear
+    return wrapper
+
+
+@maybe_lru_cache
+def _get_type_hints(obj) -> Dict[str, Any]:
+    """
+    Memoized `typing.get_type_hints()`. Returns an empty dict if the hints
+    cannot be resolved (e.g. undefined forward references) so that failing
+    objects, too, are only evaluated once rather than once per member.
+    """
+    try:
+        return typing.get_type_hints(obj)
+    except Exception:
+        return {}
 
 
 def _unwrap_descriptor(dobj):
@@ -448,6 +629,16 @@ def _unwrap_descriptor(dobj):
     return getattr(obj, '__get__', obj)
 
 
+@lru_cache()
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """Returns names of all `__slots__` of `cls` and its bases."""
+    names: List[str] = []
+    for c in cls.__mro__:
+        slots = c.__dict__.get('__slots__', ())
+        names.extend((slots,) if isinstance(slots, str) else slots)
+    return tuple(name for name in names if name not in ('__dict__', '__weakref__'))
+
+
 def _filter_type(type: Type[T],
                  values: Union[Iterable['Doc'], Mapping[str, 'Doc']]) -> List[T]:
     """
@@ -460,23 +651,45 @@ def _filter_type(type: Type[T],
 
 def _toposort(graph: Mapping[T, Set[T]]) -> Generator[T, None, None]:
     """
-    Return items of `graph` sorted in topological order.
-    Source: https://rosettacode.org/wiki/Topological_sort#Python
+    Return items of `graph` sorted in topological order
+    (Kahn's algorithm; linear in the size of the graph).
+    """
+    n_deps = {item: len(deps) for item, deps in graph.items()}
+    dependents: Dict[T, List[T]] = {}
+    for item, deps in graph.items():
+        for dep in deps:
+            dependents.setdefault(dep, []).append(item)
+
+    # Items that are only dependencies come first, then those without deps
+    ready = [dep for dep in dependents if dep not in graph]
+    ready.extend(item for item, n in n_deps.items() if not n)
+    for item in ready:  # Grows while iterated
+        yield item
+        for dependent in dependents.get(item, ()):
+            n_deps[dependent] -= 1
+            if not n_deps[dependent]:
+                ready.append(dependent)
+
+    cyclic = {item: graph[item] for item, n in n_deps.items() if n}
+    assert not cyclic, f"A cyclic dependency exists amongst {cyclic!r}"
+
+
+@lru_cache()
+def _relative_url(url: str, relative_to_url: str) -> str:
     """
-    items_without_deps = reduce(set.union, graph.values(), set()) - set(graph.keys())  # type: ignore  # noqa: E501
-    yield from items_without_deps
-    ordered = items_without_deps
-    while True:
-        graph = {item: (deps - ordered)
-                 for item, deps in graph.items()
-                 if item not in ordered}
-        ordered = {item
-                   for item, deps in graph.items()
-                   if not deps}
-        yield from ordered
-        if not ordered:
+    Returns page `url` relative to page `relative_to_url`.
+    Memoized since each page links to a handful of pages many times over.
+    """
+    # Both are normalized, '/'-separated page paths (see `Module._url()`),
+    # so no os.path.relpath() (and OS-specific separators) are needed
+    parts = url.split('/')
+    base_dirs = relative_to_url.split('/')[:-1]
+    n_common = 0
+    for part, base_dir in zip(parts, base_dirs):
+        if part != base_dir:
             break
-    assert not graph, f"A cyclic dependency exists amongst {graph!r}"
+        n_common += 1
+    return '../' * (len(base_dirs) - n_common) + '/'.join(parts[n_common:])
 
 
 def link_inheritance(context: Optional[Context] = None):
@@ -569,7 +782,7 @@ class Doc:
         available, an empty string.
         """
         try:
-            lines, _ = inspect.getsourcelines(_unwrap_descriptor(self))
+            lines = _getsourcelines(_unwrap_descriptor(self))
         except (ValueError, TypeError, OSError):
             return ''
         return inspect.cleandoc(''.join(['\n'] + lines))
@@ -618,11 +831,8 @@ class Doc:
             return f'#{self.refname}'
 
         # Otherwise, compute relative path from current module to link target
-        url = os.path.relpath(self._url(), relative_to.url()).replace(path.sep, '/')
-        # We have one set of '..' too many
-        if url.startswith('../'):
-            url = url[3:]
-        return url
+        page, sep, fragment = self._url().partition('#')
+        return _relative_url(page, relative_to.url()) + sep + fragment
 
     def _url(self):
         return f'{self.module._url()}#{self.refname}'
@@ -639,6 +849,20 @@ class Doc:
     def __lt__(self, other):
         return self.refname < other.refname
 
+    def __copy__(self):
+        # Used for inherited members. Faster than the generic
+        # __reduce_ex__()-based copy of slotted objects.
+        cls = type(self)
+        new = cls.__new__(cls)
+        for name in _slot_names(cls):
+            try:
+                setattr(new, name, getattr(self, name))
+            except AttributeError:  # Unset slot
+                pass
+        if hasattr(self, '__dict__'):  # Subclasses without __slots__
+            new.__dict__.update(self.__dict__)
+        return new
+
 
 class Module(Doc):
     """
@@ -650,7 +874,7 @@ class Module(Doc):
         """
 
     __slots__ = ('supermodule', 'doc', '_context', '_is_inheritance_linked',
-                 '_skipped_submodules')
+                 '_skipped_submodules', '__pdoc__')
 
     def __init__(self, module: Union[ModuleType, str], *,
                  docfilter: Optional[Callable[[Doc], bool]] = None,
@@ -702,6 +926,9 @@ class Module(Doc):
 
         self._skipped_submodules = set()
 
+        self.__pdoc__: dict = getattr(self.obj, '__pdoc__', {})
+        """This module's __pdoc__ dict, or an empty dict if none."""
+
         var_docstrings, _ = _pep224_docstrings(self)
 
         # Populate self.doc with this module's public members
@@ -719,26 +946,27 @@ class Module(Doc):
                     public_objs.append((name, obj))
         else:
             def is_from_this_module(obj):
-                mod = inspect.getmodule(inspect.unwrap(obj))
+                # Inlined `inspect.getmodule()` for the common case of
+                # objects that carry a `__module__` name
+                if isinstance(obj, ModuleType) or not hasattr(obj, '__module__'):
+                    mod = inspect.getmodule(obj)
+                else:
+                    mod = sys.modules.get(obj.__module__)
                 return mod is None or mod.__name__ == self.obj.__name__
 
-            for name, obj in inspect.getmembers(self.obj):
-                if ((_is_public(name) or
-                     _is_whitelisted(name, self)) and
-                        (_is_blacklisted(name, self) or  # skips unwrapping that follows
-                         is_from_this_module(obj) or
-                         name in var_docstrings)):
+            # Module __dict__ is already in definition order
+            for name, obj in list(self.obj.__dict__.items()):
+                if not (_is_public(name) or _is_whitelisted(name, self)):
+                    continue
 
-                    if _is_blacklisted(name, self):
-                        self._context.blacklisted.add(f'{self.refname}.{name}')
-                        continue
+                if _is_blacklisted(name, self):
+                    self._context.blacklisted.add(f'{self.refname}.{name}')
+                    continue
 
-                    obj = inspect.unwrap(obj)
+                obj = inspect.unwrap(obj)
+                if is_from_this_module(obj) or name in var_docstrings:
                     public_objs.append((name, obj))
 
-            index = list(self.obj.__dict__).index
-            public_objs.sort(key=lambda i: index(i[0]))
-
         for name, obj in public_objs:
             if _is_function(obj):
                 self.doc[name] = Function(name, self, obj)
@@ -818,11 +1046,6 @@ class Module(Doc):
 
     __pdoc__['Module.ImportWarning'] = False
 
-    @property
-    def __pdoc__(self) -> dict:
-        """This module's __pdoc__ dict, or an empty dict if none."""
-        return getattr(self.obj, '__pdoc__', {})
-
     def _link_inheritance(self):
         # Inherited members are already in place since
         # `Class._fill_inheritance()` has been called from
@@ -836,6 +1059,7 @@ class Module(Doc):
             return
 
         # Apply __pdoc__ overrides
+        removed_prefixes = []
         for name, docstring in self.__pdoc__.items():
             # In case of whitelisting with "True", there's nothing to do
             if docstring is True:
@@ -864,12 +1088,7 @@ class Module(Doc):
                     del cls.doc[obj.name]
                 self.doc.pop(name, None)
                 self._context.pop(refname, None)
-
-                # Pop also all that startwith refname
-                for key in list(self._context.keys()):
-                    if key.startswith(refname + '.'):
-                        del self._context[key]
-
+                removed_prefixes.append(refname + '.')
                 continue
 
             dobj = self.find_ident(refname)
@@ -880,6 +1099,12 @@ class Module(Doc):
                                  f'__pdoc__[{name!r}] is of type {type(docstring)}')
             dobj.docstring = inspect.cleandoc(docstring)
 
+        # Pop also all that startwith removed refnames, in a single pass
+        if removed_prefixes:
+            prefixes = tuple(removed_prefixes)
+            for key in [key for key in self._context if key.startswith(prefixes)]:
+                del self._context[key]
+
         # Now after docstrings are set correctly, continue the
         # inheritance routine, marking members inherited or not
         for c in _filter_type(Class, self.doc):
@@ -892,7 +1117,7 @@ class Module(Doc):
         Returns the documentation for this module as plain text.
         """
         txt = _render_template('/text.mako', module=self, **kwargs)
-        return re.sub("\n\n\n+", "\n\n", txt)
+        return _BLANK_LINES_RE.sub("\n\n", txt)
 
     def html(self, minify=True, **kwargs) -> str:
         """
@@ -964,7 +1189,9 @@ class Module(Doc):
 
     def _filter_doc_objs(self, type: Type[T], sort=True) -> List[T]:
         result = _filter_type(type, self.doc)
-        return sorted(result) if sort else result
+        if sort:
+            result.sort(key=_refname_key)
+        return result
 
     def variables(self, sort=True) -> List['Variable']:
         """
@@ -1003,39 +1230,25 @@ class Module(Doc):
         return url + _URL_MODULE_SUFFIX
 
 
-def _getmembers_all(obj: type) -> List[Tuple[str, Any]]:
+def _getattr_member(cls: type, name: str):
     # The following code based on inspect.getmembers() @ 5b23f7618d43
-    mro = obj.__mro__[:-1]  # Skip object
-    names = set(dir(obj))
-    # Add keys from bases
-    for base in mro:
-        names.update(base.__dict__.keys())
-        # Add members for which type annotations exist
-        names.update(getattr(obj, '__annotations__', {}).keys())
-
-    results = []
-    for name in names:
-        try:
-            value = getattr(obj, name)
-        except AttributeError:
-            for base in mro:
-                if name in base.__dict__:
-                    value = base.__dict__[name]
-                    break
-            else:
-                # Missing slot member or a buggy __dir__;
-                # In out case likely a type-annotated member
-                # which we'll interpret as a variable
-                value = None
-        results.append((name, value))
-    return results
+    try:
+        return getattr(cls, name)
+    except AttributeError:
+        for base in cls.__mro__[:-1]:  # Skip object
+            if name in base.__dict__:
+                return base.__dict__[name]
+        # Missing slot member or a buggy __dir__;
+        # In out case likely a type-annotated member
+        # which we'll interpret as a variable
+        return None
 
 
 class Class(Doc):
     """
     Representation of a class' documentation.
     """
-    __slots__ = ('doc', '_super_members')
+    __slots__ = ('doc', '_super_members', '_refname')
 
     def __init__(self, name: str, module: Module, obj, *, docstring: Optional[str] = None):
         assert inspect.isclass(obj)
@@ -1048,6 +1261,8 @@ class Class(Doc):
 
         super().__init__(name, module, obj, docstring=docstring)
 
+        self._refname = f'{self.module.name}.{self.qualname}'
+
         self.doc: Dict[str, Union[Function, Variable]] = {}
         """A mapping from identifier name to a `pdoc.Doc` objects."""
 
@@ -1055,55 +1270,44 @@ class Class(Doc):
         # Use only own, non-inherited annotations (the rest will be inherited)
         annotations = getattr(self.obj, '__annotations__', {})
 
-        public_objs = []
-        for _name, obj in _getmembers_all(self.obj):
-            # Filter only *own* members. The rest are inherited
-            # in Class._fill_inheritance()
-            if ((_name in self.obj.__dict__ or
-                 _name in annotations) and
-                    (_is_public(_name) or
-                     _is_whitelisted(_name, self))):
-
-                if _is_blacklisted(_name, self):
-                    self.module._context.blacklisted.add(f'{self.refname}.{_name}')
-                    continue
+        # Filter only *own* members, in definition order (annotated-only first).
+        # The rest are inherited in Class._fill_inheritance()
+        own_dict = self.obj.__dict__
+        own_names = [name for name in annotations if name not in own_dict]
+        own_names.extend(own_dict)
 
-                obj = inspect.unwrap(obj)
-                public_objs.append((_name, obj))
+        whitelisted, blacklisted = _pdoc_overrides(self)
+        public_objs = []
+        for _name in own_names:
+            if not (_is_public(_name) or _name in whitelisted):
+                continue
 
-        def definition_order_index(
-                name,
-                _annot_index=list(annotations).index,
-                _dict_index=list(self.obj.__dict__).index):
-            try:
-                return _dict_index(name)
-            except ValueError:
-                pass
-            try:
-                return _annot_index(name) - len(annotations)  # sort annotated first
-            except ValueError:
-                return 9e9
+            if _name in blacklisted:
+                self.module._context.blacklisted.add(f'{self.refname}.{_name}')
+                continue
 
-        public_objs.sort(key=lambda i: definition_order_index(i[0]))
+            obj = inspect.unwrap(_getattr_member(self.obj, _name))
+            public_objs.append((_name, obj))
 
         var_docstrings, instance_var_docstrings = _pep224_docstrings(self)
 
         # Convert the public Python objects to documentation objects.
+        slots = getattr(self.obj, '__slots__', ())
         for name, obj in public_objs:
             if _is_function(obj):
                 self.doc[name] = Function(
                     name, self.module, obj, cls=self)
             else:
+                is_descriptor = _is_descriptor(obj)
                 self.doc[name] = Variable(
                     name, self.module,
                     docstring=(
                         var_docstrings.get(name) or
-                        (inspect.isclass(obj) or _is_descriptor(obj)) and inspect.getdoc(obj)),
+                        (inspect.isclass(obj) or is_descriptor) and inspect.getdoc(obj)),
                     cls=self,
                     kind="prop" if isinstance(obj, property) else "var",
-                    obj=_is_descriptor(obj) and obj or None,
-                    instance_var=(_is_descriptor(obj) or
-                                  name in getattr(self.obj, '__slots__', ())))
+                    obj=is_descriptor and obj or None,
+                    instance_var=is_descriptor or name in slots)
 
         for name, docstring in instance_var_docstrings.items():
             self.doc[name] = Variable(
@@ -1112,6 +1316,7 @@ class Class(Doc):
                 instance_var=True)
 
     @staticmethod
+    @maybe_lru_cache
     def _method_type(cls: type, name: str):
         """
         Returns `None` if the method `name` of class `cls`
@@ -1123,7 +1328,7 @@ class Class(Doc):
             # If the function is already bound, it's a classmethod.
             # Regular methods are not bound before initialization.
             return classmethod
-        for c in inspect.getmro(cls):
+        for c in cls.__mro__:
             if name in c.__dict__:
                 if isinstance(c.__dict__[name], staticmethod):
                     return staticmethod
@@ -1132,7 +1337,7 @@ class Class(Doc):
 
     @property
     def refname(self) -> str:
-        return f'{self.module.name}.{self.qualname}'
+        return self._refname
 
     def mro(self, only_documented=False) -> List['Class']:
         """
@@ -1143,7 +1348,7 @@ class Class(Doc):
         if the types are documented, and `pdoc.External` otherwise.
         """
         classes = [cast(Class, self.module.find_class(c))
-                   for c in inspect.getmro(self.obj)
+                   for c in self.obj.__mro__
                    if c not in (self.obj, object)]
         if self in classes:
             # This can contain self in case of a class inheriting from
@@ -1165,8 +1370,9 @@ class Class(Doc):
         The objects in the list are of type `pdoc.Class` if available,
         and `pdoc.External` otherwise.
         """
-        return sorted(cast(Class, self.module.find_class(c))
-                      for c in type.__subclasses__(self.obj))
+        return sorted((cast(Class, self.module.find_class(c))
+                       for c in type.__subclasses__(self.obj)),
+                      key=_refname_key)
 
     def params(self, *, annotate=False, link=None) -> List[str]:
         """
@@ -1185,9 +1391,13 @@ class Class(Doc):
     def _filter_doc_objs(self, type: Type[T], include_inherited=True,
                          filter_func: Callable[[T], bool] = lambda x: True,
                          sort=True) -> List[T]:
-        result = [obj for obj in _filter_type(type, self.doc)
-                  if (include_inherited or not obj.inherits) and filter_func(obj)]
-        return sorted(result) if sort else result
+        result: List[T] = [obj for obj in self.doc.values()  # type: ignore[misc]
+                           if (isinstance(obj, type) and
+                               (include_inherited or not obj.inherits) and
+                               filter_func(obj))]
+        if sort:
+            result.sort(key=_refname_key)
+        return result
 
     def class_variables(self, include_inherited=True, sort=True) -> List['Variable']:
         """
@@ -1232,7 +1442,7 @@ class Class(Doc):
         (ancestor class, list of ancestor class' members sorted by name),
         sorted by MRO.
         """
-        return sorted(((cast(Class, k), sorted(g))
+        return sorted(((cast(Class, k), sorted(g, key=_refname_key))
                        for k, g in groupby((i.inherits
                                             for i in self.doc.values() if i.inherits),
                                            key=lambda i: i.cls)),                   # type: ignore
@@ -1283,17 +1493,7 @@ class Class(Doc):
         del self._super_members
 
 
-def maybe_lru_cache(func):
-    cached_func = lru_cache()(func)
-
-    @wraps(func)
-    def wrapper(*args):
-        try:
-            return cached_func(*args)
-        except TypeError:
-            return func(*args)
-
-    return wrapper
+_signature = maybe_lru_cache(inspect.signature)
 
 
 @maybe_lru_cache
@@ -1423,6 +1623,7 @@ class Function(Doc):
         return 'async def' if self._is_async else 'def'
 
     @property
+    @lru_cache()
     def _is_async(self):
         """
         Returns whether is function is asynchronous, either as a coroutine or an async
@@ -1447,7 +1648,7 @@ class Function(Doc):
                 # global variables
                 lambda: _get_type_hints(not self.cls and self.module.obj)[self.name],
                 # properties
-                lambda: inspect.signature(_unwrap_descriptor(self)).return_annotation,
+                lambda: _signature(_unwrap_descriptor(self)).return_annotation,
                 # Use raw annotation strings in unmatched forward declarations
                 lambda: cast(Class, self.cls).obj.__annotations__[self.name],
                 # Extract annotation from the docstring for C builtin function
@@ -1471,13 +1672,12 @@ class Function(Doc):
             s = annot
         else:
             s = _formatannotation(annot)
-            s = re.sub(r'\bForwardRef\((?P<quot>[\"\'])(?P<str>.*?)(?P=quot)\)',
-                       r'\g<str>', s)
+            s = _FORWARD_REF_RE.sub(r'\g<str>', s)
         s = s.replace(' ', '\N{NBSP}')  # Better line breaks in html signatures
 
         if link:
             from pdoc.html_helpers import _linkify
-            s = re.sub(r'[\w\.]+', partial(_linkify, link=link, module=self.module), s)
+            s = _DOTTED_NAME_RE.sub(partial(_linkify, link=link, module=self.module), s)
         return s
 
     def params(self, *, annotate: bool = False,
@@ -1505,11 +1705,11 @@ class Function(Doc):
                 and doc_obj.obj.__init__ is not object.__init__
             ):
                 # Remove the first argument (self) from __init__ signature
-                init_sig = inspect.signature(doc_obj.obj.__init__)
+                init_sig = _signature(doc_obj.obj.__init__)
                 init_params = list(init_sig.parameters.values())
                 signature = init_sig.replace(parameters=init_params[1:])
             else:
-                signature = inspect.signature(doc_obj.obj)
+                signature = _signature(doc_obj.obj)
         except ValueError:
             signature = Function._signature_from_string(doc_obj)
             if not signature:
@@ -1520,23 +1720,24 @@ class Function(Doc):
             if value is inspect.Parameter.empty:
                 return p
 
-            replacement = next((i for i in ('os.environ',
-                                            'sys.stdin',
-                                            'sys.stdout',
-                                            'sys.stderr',)
-                                if value is eval(i)), None)
+            replacement = next((name for name, obj in (('os.environ', os.environ),
+                                                       ('sys.stdin', sys.stdin),
+                                                       ('sys.stdout', sys.stdout),
+                                                       ('sys.stderr', sys.stderr))
+                                if value is obj), None)
             if not replacement:
+                value_repr = repr(value)
                 if isinstance(value, enum.Enum):
                     replacement = str(value)
                 elif inspect.isclass(value):
                     replacement = f'{value.__module__ or _UNKNOWN_MODULE}.{value.__qualname__}'
-                elif ' at 0x' in repr(value):
-                    replacement = re.sub(r' at 0x\w+', '', repr(value))
+                elif ' at 0x' in value_repr:
+                    replacement = _OBJ_ADDRESS_RE.sub('', value_repr)
 
                 nonlocal link
-                if link and ('<' in repr(value) or '>' in repr(value)):
+                if link and ('<' in value_repr or '>' in value_repr):
                     import html
-                    replacement = html.escape(replacement or repr(value))
+                    replacement = html.escape(replacement or value_repr)
 
             if replacement:
                 class mock:
@@ -1582,7 +1783,7 @@ class Function(Doc):
                 if isinstance(p.annotation, str):
                     annotation = annotation.strip("'")
                 if link:
-                    annotation = re.sub(r'[\w\.]+', _linkify, annotation)
+                    annotation = _DOTTED_NAME_RE.sub(_linkify, annotation)
                 formatted += f':\N{NBSP}{annotation}'
             if p.default is not EMPTY:
                 if p.annotation is not EMPTY:
@@ -1717,6 +1918,8 @@ class External(Doc):
         form.
         """
 
+    __slots__ = ()
+
     def __init__(self, name: str):
         """
         Initializes an external identifier with `name`, where `name`
@@ -32,17 +32,16 @@ def minify_css(css: str,
 
 
 def minify_html(html: str,
-                _minify=partial(
-                    re.compile(r'(.*?)(<pre\b.*?</pre\b\s*>)|(.*)', re.IGNORECASE | re.DOTALL).sub,
-                    lambda m, _norm_space=partial(re.compile(r'\s\s+').sub, '\n'): (
-                        _norm_space(m.group(1) or '') +
-                        (m.group(2) or '') +
-                        _norm_space(m.group(3) or '')))):
+                _split_pre=re.compile(r'(<pre\b.*?</pre\b\s*>)', re.IGNORECASE | re.DOTALL).split,
+                _norm_space=partial(re.compile(r'\s\s+').sub, '\n')):
     """
     Minify HTML by replacing all consecutive whitespace with a single space
     (or newline) character, except inside `<pre>` tags.
     """
-    return _minify(html)
+    # Even items are the text between <pre> blocks, odd items the blocks themselves
+    parts = _split_pre(html)
+    parts[::2] = map(_norm_space, parts[::2])
+    return ''.join(parts)
 
 
 def glimpse(text: str, max_length=153, *, paragraph=True,
@@ -284,6 +283,16 @@ class _ToMarkdown:
                                                  _ToMarkdown._directive_opts(text), module)
             except Exception as e:
                 raise RuntimeError(f'`.. include:: {value}` error in module {module.name!r}: {e}')
+        return _ToMarkdown._directive(indent, type, value, text)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _directive(indent, type, value, text):
+        """
+        Returns Markdown for a single (non-include) reST directive.
+        Cached since the same boilerplate directives (notes, deprecations,
+        ...) tend to repeat across a project's docstrings.
+        """
         if type in ('image', 'figure'):
             alt_text = text.translate(str.maketrans({
                 '\n': ' ',
@@ -314,6 +323,9 @@ class _ToMarkdown:
         text = _ToMarkdown.indent(indent + '    ', text, clean_first=True)
         return f'{indent}!!! {type} "{title}"\n{text}\n'
 
+    ADMONITION_RE = re.compile(r'^(?P<indent> *)\.\. ?(\w+)::(?: *(.*))?'
+                               r'((?:\n(?:(?P=indent) +.*| *$))*[^\r\n])*', re.MULTILINE)
+
     @staticmethod
     def admonitions(text, module, limit_types=None):
         """
@@ -325,14 +337,29 @@ class _ToMarkdown:
 
         See: https://python-markdown.github.io/extensions/admonition/
         """
-        substitute = partial(re.compile(r'^(?P<indent> *)\.\. ?(\w+)::(?: *(.*))?'
-                                        r'((?:\n(?:(?P=indent) +.*| *$))*[^\r\n])*',
-                                        re.MULTILINE).sub,
+        if limit_types is not None:
+            limit_types = frozenset(limit_types)
+        if module and 'include::' in text:
+            # Output depends on the (possibly edited) included files; don't cache
+            return _ToMarkdown._admonitions(text, module, limit_types)
+        return _ToMarkdown._admonitions_cached(text, limit_types)
+
+    @staticmethod
+    def _admonitions(text, module, limit_types):
+        substitute = partial(_ToMarkdown.ADMONITION_RE.sub,
                              partial(_ToMarkdown._admonition, module=module,
                                      limit_types=limit_types))
         # Apply twice for nested (e.g. image inside warning)
         return substitute(substitute(text))
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _admonitions_cached(text, limit_types):
+        # The same docstrings (e.g. inherited members, module docstrings
+        # on index pages) are converted over and over again during a run.
+        # Without include directives, the module doesn't affect the output.
+        return _ToMarkdown._admonitions(text, None, limit_types)
+
     @staticmethod
     def _include_file(indent: str, path: str, options: dict, module: pdoc.Module) -> str:
         start_line = int(options.get('start-line', 0))
@@ -340,9 +367,9 @@ class _ToMarkdown:
         start_after = options.get('start-after')
         end_before = options.get('end-before')
 
-        with open(os.path.normpath(os.path.join(os.path.dirname(module.obj.__file__), path)),
-                  encoding='utf-8') as f:
-            text = ''.join(list(f)[start_line:end_line])
+        filename = os.path.normpath(os.path.join(os.path.dirname(module.obj.__file__), path))
+        lines = _ToMarkdown._read_include(filename, os.stat(filename).st_mtime_ns)
+        text = ''.join(lines[start_line:end_line])
 
         if start_after:
             text = text[text.index(start_after) + len(start_after):]
@@ -351,6 +378,16 @@ class _ToMarkdown:
 
         return _ToMarkdown.indent(indent, text)
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _read_include(filename: str, mtime_ns: int) -> tuple:
+        """
+        Returns lines of included file `filename`. Keyed on file
+        modification time so that edited files are re-read.
+        """
+        with open(filename, encoding='utf-8') as f:
+            return tuple(f)
+
     @staticmethod
     def _directive_opts(text: str) -> dict:
         return dict(re.findall(r'^ *:([^:]+): *(.*)', text, re.MULTILINE))
@@ -433,6 +470,12 @@ def to_html(text: str, *,
     return _md.reset().convert(md)
 
 
+_CODE_SPAN_RE = re.compile(r'(?P<inside_link>\[[^\]]*?)?'
+                           r'(?:(?<!\\)(?:\\{2})+(?=`)|(?<!\\)(?P<fence>`+)'
+                           r'(?P<code>.+?)(?<!`)'
+                           r'(?P=fence)(?!`))')
+
+
 def to_markdown(text: str, *,
                 docformat: Optional[str] = None,
                 module: Optional[pdoc.Module] = None,
@@ -477,13 +520,10 @@ def to_markdown(text: str, *,
             # https://github.com/Python-Markdown/markdown/blob/ada40c66/markdown/inlinepatterns.py#L106
             # Also avoid linking triple-backticked arg names in deflists.
             linkify = partial(_linkify, link=link, module=module, wrap_code=True)
-            text = re.sub(r'(?P<inside_link>\[[^\]]*?)?'
-                          r'(?:(?<!\\)(?:\\{2})+(?=`)|(?<!\\)(?P<fence>`+)'
-                          r'(?P<code>.+?)(?<!`)'
-                          r'(?P=fence)(?!`))',
-                          lambda m: (m.group()
-                                     if m.group('inside_link') or len(m.group('fence')) > 2
-                                     else linkify(m)), text)
+            text = _CODE_SPAN_RE.sub(
+                lambda m: (m.group()
+                           if m.group('inside_link') or len(m.group('fence')) > 2
+                           else linkify(m)), text)
         result[0] = text
     text = result[0]
 
@@ -499,14 +539,16 @@ class ReferenceWarning(UserWarning):
     """
 
 
-def _linkify(match: Match, *, link: Callable[..., str], module: pdoc.Module, wrap_code=False):
+def _linkify(match: Match, *, link: Callable[..., str], module: pdoc.Module, wrap_code=False,
+             _is_type_annotation=re.compile(r'^[`\w\s.,\[\]()]+$').match,
+             _link_refnames=re.compile(r'[a-zA-Z_]\w*(?:\.[a-zA-Z_]\w*)*(?:\(\))?').sub,
+             _escape_underscores=partial(re.compile(r'(_(?=[^>]*?(?:<|$)))').sub, r'\\\1')):
     try:
         code_span = match.group('code')
     except IndexError:
         code_span = match.group()
 
-    is_type_annotation = re.match(r'^[`\w\s.,\[\]()]+$', code_span)
-    if not is_type_annotation:
+    if not _is_type_annotation(code_span):
         return match.group()
 
     def handle_refname(match):
@@ -529,14 +571,14 @@ def _linkify(match: Match, *, link: Callable[..., str], module: pdoc.Module, wra
 
     if wrap_code:
         code_span = code_span.replace('[', '\\[')
-    linked = re.sub(r'[a-zA-Z_]\w*(?:\.[a-zA-Z_]\w*)*(?:\(\))?', handle_refname, code_span)
+    linked = _link_refnames(handle_refname, code_span)
     if wrap_code:
         # Wrapping in HTML <code> as opposed to backticks evaluates markdown */_ markers,
         # so let's escape them in text (but not in HTML tag attributes).
         # Backticks also cannot be used because html returned from `link()`
         # would then become escaped.
         # This finds overlapping matches, https://stackoverflow.com/a/5616910/1090455
-        cleaned = re.sub(r'(_(?=[^>]*?(?:<|$)))', r'\\\1', linked)
+        cleaned = _escape_underscores(linked)
         return f'<code>{cleaned}</code>'
     return linked
 
@@ -31,7 +31,7 @@ from urllib.request import Request, urlopen
 import pdoc
 from pdoc import cli
 from pdoc.html_helpers import (
-    minify_css, minify_html, glimpse, to_html,
+    minify_css, minify_html, glimpse, to_html, to_markdown,
     ReferenceWarning, extract_toc, format_git_link,
 )
 
@@ -526,6 +526,51 @@ class ApiTest(unittest.TestCase):
         with chdir(os.path.join(TESTS_BASEDIR, EXAMPLE_MODULE)):
             pdoc.import_module('_imported_once.py')
 
+    def test_import_module_reload(self):
+        with patch('importlib.reload', side_effect=lambda m: m) as reload, \
+                patch.dict(pdoc._module_mtimes, clear=True):
+            pdoc.import_module(EXAMPLE_MODULE, reload=True)
+            reloaded = [call[0][0].__name__ for call in reload.call_args_list]
+            self.assertEqual(reloaded.count(EXAMPLE_MODULE), 1)
+            self.assertTrue(all(name == EXAMPLE_MODULE or name.startswith(EXAMPLE_MODULE + '.')
+                                for name in reloaded))
+
+            # Unchanged since the last load; not reloaded again
+            reload.reset_mock()
+            pdoc.import_module(EXAMPLE_MODULE, reload=True)
+            self.assertFalse(reload.called)
+
+            pdoc._module_mtimes[EXAMPLE_MODULE] = {}
+            pdoc.import_module(EXAMPLE_MODULE, reload=True)
+            self.assertTrue(reload.called)
+
+        # Reloading a submodule must not make its parent (re-exporting from it,
+        # cf. issue #264) look up to date
+        with temp_dir() as path, \
+                patch.object(sys, 'path', [path] + sys.path), \
+                patch.dict(sys.modules), \
+                patch.dict(pdoc._module_mtimes, clear=True):
+            pkg = os.path.join(path, '_pdoc_reload_pkg')
+            os.mkdir(pkg)
+            with open(os.path.join(pkg, '__init__.py'), 'w') as f:
+                f.write('from .sub import foo\n__all__ = ["foo"]\n')
+            sub_file = os.path.join(pkg, 'sub.py')
+            with open(sub_file, 'w') as f:
+                f.write('def foo():\n    """v1"""\n')
+
+            mod = pdoc.import_module('_pdoc_reload_pkg', reload=True)
+            pdoc.import_module('_pdoc_reload_pkg.sub', reload=True)
+            self.assertEqual(mod.foo.__doc__, 'v1')
+
+            with open(sub_file, 'w') as f:
+                f.write('def foo():\n    """v2 (edited)"""\n')
+            mtime = os.stat(sub_file).st_mtime + 10  # Invalidate the bytecode cache
+            os.utime(sub_file, (mtime, mtime))
+
+            pdoc.import_module('_pdoc_reload_pkg.sub', reload=True)
+            mod = pdoc.import_module('_pdoc_reload_pkg', reload=True)
+            self.assertEqual(mod.foo.__doc__, 'v2 (edited)')
+
     def test_namespace(self):
         # Test the three namespace types
         # https://packaging.python.org/guides/packaging-namespace-packages/#creating-a-namespace-package
@@ -561,6 +606,18 @@ class ApiTest(unittest.TestCase):
         self.assertEqual(var.docstring, """Read-only value descriptor""")
         self.assertTrue(var.source)
 
+    def test_class_source(self):
+        def local():
+            @typing.final
+            class Local:
+                x: int
+            return Local
+
+        mod = EXAMPLE_PDOC_MODULE.obj
+        for cls in (mod.B, mod.B.C, mod.D, local()):
+            expected = inspect.cleandoc(''.join(['\n'] + inspect.getsourcelines(cls)[0]))
+            self.assertEqual(pdoc.Class(cls.__name__, DUMMY_PDOC_MODULE, cls).source, expected)
+
     def test_class_variables_docstring_not_from_obj(self):
         class C:
             vars_dont = 0
@@ -845,6 +902,16 @@ class ApiTest(unittest.TestCase):
         # say so, because public classes do want to be exposed and linked to
         self.assertNotEqual(b.inherits, a)
 
+    def test_toposort(self):
+        graph = {'d': {'b', 'c', 'a'}, 'b': {'a'}, 'c': {'a', 'x'}, 'a': set()}
+        order = list(pdoc._toposort(graph))
+        self.assertCountEqual(order, ['a', 'b', 'c', 'd', 'x'])
+        for item, deps in graph.items():
+            self.assertTrue(all(order.index(dep) < order.index(item) for dep in deps))
+
+        with self.assertRaises(AssertionError):
+            list(pdoc._toposort({'a': {'b'}, 'b': {'a'}}))
+
     def test_context(self):
         context = pdoc.Context()
         pdoc.Module(pdoc, context=context)
@@ -1106,6 +1173,12 @@ class Foo:
         self.assertEqual(f.url(relative_to=c.module), '#example_pkg.D.overridden')
         self.assertEqual(f.url(top_ancestor=1), 'example_pkg/index.html#example_pkg.B.overridden')
 
+        subpkg, module = mod.doc['subpkg'], mod.doc['module']
+        self.assertEqual(c.url(relative_to=subpkg), '../index.html#example_pkg.D')
+        self.assertEqual(subpkg.url(relative_to=mod), 'subpkg/index.html')
+        self.assertEqual(subpkg.url(relative_to=module), 'subpkg/index.html')
+        self.assertEqual(module.url(relative_to=subpkg), '../module.html')
+
     def test_sorting(self):
         module = EXAMPLE_PDOC_MODULE
 
@@ -1193,6 +1266,44 @@ class C:
             self.assertEqual(mod.doc['C'].doc['class_var'].docstring, 'class var')
             self.assertEqual(mod.doc['C'].doc['instance_var'].docstring, 'instance var')
 
+    def test_pep224_docstrings_non_str_constant(self):
+        with temp_dir() as path:
+            filename = os.path.join(path, 'pep224_non_str.py')
+            with open(filename, 'w') as f:
+                f.write('''var1 = 1
+2
+
+var2 = 1
+"""Docstring"""
+''')
+
+            mod = pdoc.Module(pdoc.import_module(filename))
+
+            self.assertNotIn('var1', mod.doc)
+            self.assertEqual(mod.doc['var2'].docstring, 'Docstring')
+
+    def test_pep224_comment_docstrings_first_wins(self):
+        with temp_dir() as path:
+            filename = os.path.join(path, 'pep224_comments_twice.py')
+            with open(filename, 'w') as f:
+                f.write('''#: first comment
+x = 1
+#: second comment
+x = 2
+
+
+class C:
+    #: first comment
+    y = 1
+    #: second comment
+    y = 2
+''')
+
+            mod = pdoc.Module(pdoc.import_module(filename))
+
+            self.assertEqual(mod.doc['x'].docstring, 'first comment')
+            self.assertEqual(mod.doc['C'].doc['y'].docstring, 'first comment')
+
     @expectedFailure
     def test_mock_signature_error(self):
         # GH-350 -- throws `TypeError: 'Mock' object is not subscriptable`:
@@ -1638,6 +1749,23 @@ x =</p>
         self.assertIn('Command-line interface',
                       self._module.docstring)
 
+    def test_reST_include_edited(self):
+        with temp_dir() as path:
+            filename = os.path.join(path, 'reST_include_edited.py')
+            with open(filename, 'w') as f:
+                f.write('"""Module."""\n')
+            part = os.path.join(path, 'part.md')
+            with open(part, 'w') as f:
+                f.write('v1')
+            mod = pdoc.Module(pdoc.import_module(filename))
+            self.assertEqual(to_markdown('.. include:: part.md', module=mod), 'v1')
+
+            with open(part, 'w') as f:
+                f.write('v2')
+            mtime = os.stat(part).st_mtime + 10
+            os.utime(part, (mtime, mtime))
+            self.assertEqual(to_markdown('.. include:: part.md', module=mod), 'v2')
+
     def test_urls(self):
         text = """Beautiful Soup
 <a href="https://travis-ci.org/cs01/pygdbmi"><img src="https://foo" /></a>